@@ -1,5 +1,15 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import hashlib
+import json
+import os
+import random
+import sys
+
+
+# Por encima de estos tamaños se usa draw_large_graph
+LARGE_GRAPH_NODES = 200
+LARGE_GRAPH_EDGES = 1000
+LAYOUT_BACKBONE_NODES = 1000
+MAX_DRAWN_EDGES = 20000
 
 
 def draw_graph(edges, title):
@@ -9,7 +19,17 @@ def draw_graph(edges, title):
     Complejidad:
     - Construcción del grafo: O(E)
     - Layout (spring_layout): O(V + E)
+
+    Grafos con más de LARGE_GRAPH_NODES nodos o LARGE_GRAPH_EDGES aristas
+    se delegan a draw_large_graph.
     """
+    nodes = {u for u, _, _ in edges} | {v for _, v, _ in edges}
+    if len(nodes) > LARGE_GRAPH_NODES or len(edges) > LARGE_GRAPH_EDGES:
+        draw_large_graph(edges, title)
+        return
+
+    import networkx as nx
+    import matplotlib.pyplot as plt
 
     G = nx.DiGraph()
 
@@ -30,7 +50,7 @@ def draw_graph(edges, title):
     edge_labels = {(u, v): w for u, v, w in edges}
     nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_labels)
 
-    filename = title.lower().replace(" ", "_").replace(":", "") + ".png"
+    filename = _filename(title, ".png")
     plt.title(title)
     plt.savefig(filename, bbox_inches="tight")
     plt.close()
@@ -38,6 +58,227 @@ def draw_graph(edges, title):
     print(f"[✓] PNG generado: {filename}")
 
 
+def _filename(title, ext):
+    return title.lower().replace(" ", "_").replace(":", "") + ext
+
+
+def _edges_fingerprint(edges):
+    """
+    Huella del conjunto de aristas (sin pesos) para validar el cache
+    Complejidad: O(E log E)
+    """
+    pairs = sorted({(u, v) for u, v, _ in edges})
+    digest = hashlib.sha1(repr(pairs).encode()).hexdigest()
+    return f"{len(pairs)}:{digest}"
+
+
+def _backbone_layout(nodes, edges):
+    """
+    Layout escalable para grafos grandes sin coordenadas
+
+    1. spring_layout solo sobre los LAYOUT_BACKBONE_NODES nodos de mayor
+       grado (subgrafo inducido)
+    2. El resto se coloca por BFS desde los ya ubicados: cada nodo va al
+       promedio de sus vecinos ubicados más un desplazamiento aleatorio
+       del tamaño de una arista típica. Componentes sin ubicar empiezan
+       en un punto aleatorio del área del backbone.
+
+    Complejidad:
+    - Backbone: O(B^2) por iteración, B = LAYOUT_BACKBONE_NODES (constante)
+    - Resto: O(V + E)
+    """
+    import networkx as nx
+
+    neighbours = {n: [] for n in nodes}
+    for u, v, _ in edges:
+        if u != v:
+            neighbours[u].append(v)
+            neighbours[v].append(u)
+
+    by_degree = sorted(nodes, key=lambda n: len(neighbours[n]), reverse=True)
+    backbone = set(by_degree[:LAYOUT_BACKBONE_NODES])
+
+    B = nx.Graph()
+    B.add_nodes_from(backbone)
+    B.add_edges_from(
+        (u, v) for u, v, _ in edges if u in backbone and v in backbone
+    )
+    pos = {
+        n: (float(x), float(y))
+        for n, (x, y) in nx.spring_layout(B, seed=42, iterations=50).items()
+    }
+
+    # Longitud típica de arista del backbone (1 / sqrt(B) si no hay aristas)
+    lengths = sorted(
+        ((pos[u][0] - pos[v][0]) ** 2 + (pos[u][1] - pos[v][1]) ** 2) ** 0.5
+        for u, v in B.edges()
+    )
+    step = lengths[len(lengths) // 2] if lengths else len(backbone) ** -0.5
+    step = step or len(backbone) ** -0.5
+
+    rng = random.Random(42)
+    queue = list(backbone)
+    head = 0
+    for start in by_degree:                       # O(V)
+        if start not in pos:
+            # Componente no alcanzada desde lo ya ubicado
+            pos[start] = (rng.uniform(-1, 1), rng.uniform(-1, 1))
+            queue.append(start)
+
+        while head < len(queue):                  # O(V + E)
+            u = queue[head]
+            head += 1
+            for v in neighbours[u]:
+                if v in pos:
+                    continue
+                placed = [pos[n] for n in neighbours[v] if n in pos]
+                x = sum(p[0] for p in placed) / len(placed)
+                y = sum(p[1] for p in placed) / len(placed)
+                pos[v] = (x + rng.gauss(0, step), y + rng.gauss(0, step))
+                queue.append(v)
+
+    return pos
+
+
+def load_or_compute_layout(edges, layout_file, pos=None):
+    """
+    Devuelve {nodo: (x, y)} usando un layout cacheado en disco
+
+    - Si layout_file existe y fue calculado para el mismo conjunto de
+      aristas (misma huella), se reutiliza
+    - Si se pasa pos (p. ej. coordenadas de un grafo tipo malla), se usa
+    - Si no, spring_layout para grafos pequeños y _backbone_layout para
+      grafos grandes
+
+    Complejidad:
+    - Cache: O(V + E log E) por la huella
+    - _backbone_layout: O(V + E) más un spring_layout de tamaño fijo
+    """
+    nodes = set()
+    for u, v, _ in edges:
+        nodes.add(u)
+        nodes.add(v)
+
+    fingerprint = _edges_fingerprint(edges)
+
+    if pos is None and os.path.exists(layout_file):
+        with open(layout_file) as f:
+            cached = json.load(f)
+        if cached.get("fingerprint") == fingerprint:
+            return {int(k): tuple(xy) for k, xy in cached["pos"].items()}
+
+    if pos is None and len(nodes) > LARGE_GRAPH_NODES:
+        pos = _backbone_layout(nodes, edges)
+    elif pos is None:
+        import networkx as nx
+
+        G = nx.Graph()
+        G.add_nodes_from(nodes)
+        G.add_edges_from((u, v) for u, v, _ in edges)
+        pos = nx.spring_layout(G, seed=42)
+
+    pos = {int(n): (float(x), float(y)) for n, (x, y) in pos.items()}
+
+    with open(layout_file, "w") as f:
+        json.dump({
+            "fingerprint": fingerprint,
+            "pos": {str(n): xy for n, xy in pos.items()}
+        }, f)
+
+    return pos
+
+
+def _overlay_edges(path=None, prev=None):
+    """Aristas de una ruta [s, ..., t] y/o de un árbol de predecesores."""
+    overlay = []
+    if path:
+        overlay.extend(zip(path, path[1:]))
+    if prev:
+        overlay.extend((p, v) for v, p in prev.items() if p is not None)
+    return overlay
+
+
+def draw_large_graph(edges, title, path=None, prev=None, pos=None,
+                     max_edges=MAX_DRAWN_EDGES):
+    """
+    Genera un PNG de un grafo grande sin etiquetas
+
+    - Layout cacheado junto al PNG (<nombre>.layout.json)
+    - Si hay más de max_edges aristas se dibuja una muestra aleatoria
+    - Todas las aristas se dibujan con una sola LineCollection
+    - path (lista de nodos) y prev (árbol de dijkstra/bellman_ford)
+      se resaltan encima del grafo
+
+    Complejidad:
+    - Layout cacheado: O(V)
+    - Muestreo y segmentos: O(E)
+    - Dibujo: O(min(E, max_edges)) en una sola llamada
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
+    filename = _filename(title, ".png")
+    pos = load_or_compute_layout(
+        edges, _filename(title, ".layout.json"), pos
+    )
+
+    drawn = edges
+    if len(edges) > max_edges:
+        drawn = random.Random(42).sample(edges, max_edges)
+
+    fig, ax = plt.subplots(figsize=(12, 12))
+
+    segments = [(pos[u], pos[v]) for u, v, _ in drawn]
+    ax.add_collection(LineCollection(
+        segments, colors="gray", linewidths=0.3, alpha=0.4
+    ))
+
+    xs = [xy[0] for xy in pos.values()]
+    ys = [xy[1] for xy in pos.values()]
+    node_size = 4 if len(pos) > LARGE_GRAPH_NODES else 40
+    ax.scatter(xs, ys, s=node_size, c="steelblue", linewidths=0)
+
+    overlay = _overlay_edges(path, prev)
+    if overlay:
+        ax.add_collection(LineCollection(
+            [(pos[u], pos[v]) for u, v in overlay],
+            colors="red", linewidths=1.5
+        ))
+        marked = {n for e in overlay for n in e}
+        ax.scatter(
+            [pos[n][0] for n in marked], [pos[n][1] for n in marked],
+            s=node_size * 3, c="red", linewidths=0
+        )
+
+    ax.autoscale()
+    ax.set_aspect("equal")
+    ax.axis("off")
+    sampled = f" (muestra de {len(drawn)}/{len(edges)} aristas)" \
+        if len(drawn) < len(edges) else ""
+    ax.set_title(title + sampled)
+    fig.savefig(filename, bbox_inches="tight", dpi=150)
+    plt.close(fig)
+
+    print(f"[✓] PNG generado: {filename}")
+
+
+def shortest_path_overlay(edges, source, target):
+    """
+    Calcula con dijkstra la ruta source → target para resaltarla
+    (requiere la raíz del repositorio en sys.path, ver __main__)
+    Complejidad: O((V + E) log V)
+    """
+    from structures.graph import Graph
+    from shortest_path import dijkstra, get_shortest_path
+
+    n = 1 + max(max(u, v) for u, v, _ in edges)
+    g = Graph(n)
+    for u, v, w in edges:
+        g.add_edge(u, v, w)
+
+    _, prev = dijkstra(g, source)
+    return get_shortest_path(prev, source, target)
+
 
 def get_graph_cases():
     cases = {}
@@ -70,7 +311,7 @@ def get_graph_cases():
         ]
     }
 
-    # CASO 4: Grafo grande y disperso (NO dibujar)
+    # CASO 4: Grafo grande y disperso (se dibuja con draw_large_graph)
     edges_sparse = []
     for i in range(49):
         edges_sparse.append((i, i + 1, 1))
@@ -96,6 +337,17 @@ def get_graph_cases():
     return cases
 
 
+def draw_case(i, case):
+    edges = case["edges"]
+    title = f"CASO {i}: {case['name']}"
+
+    if i == 4:
+        path = shortest_path_overlay(edges, 0, 49)
+        draw_large_graph(edges, title, path=path)
+    else:
+        draw_graph(edges, title)
+
+
 def main():
     cases = get_graph_cases()
 
@@ -103,30 +355,23 @@ def main():
     print("1 → Grafo pequeño (DAG)")
     print("2 → Pesos negativos")
     print("3 → Grafo con ciclos")
-    print("4 → Grafo grande (omitido)")
+    print("4 → Grafo grande (sin etiquetas, con ruta 0 → 49)")
     print("5 → Grafo denso")
-    print("0 → Generar TODOS menos el 4")
+    print("0 → Generar TODOS")
 
     option = int(input("\nOpción: "))
 
     if option == 0:
         for i in cases:
-            if i != 4:
-                draw_graph(
-                    cases[i]["edges"],
-                    f"CASO {i}: {cases[i]['name']}"
-                )
+            draw_case(i, cases[i])
     elif option in cases:
-        if option == 4:
-            print("⚠️ El grafo 4 es muy grande y se omite automáticamente.")
-        else:
-            draw_graph(
-                cases[option]["edges"],
-                f"CASO {option}: {cases[option]['name']}"
-            )
+        draw_case(option, cases[option])
     else:
         print("Opción inválida")
 
 
 if __name__ == "__main__":
+    # Permite importar structures/shortest_path al ejecutar desde Images/
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.append(root)
     main()
@@ -0,0 +1,105 @@
+import os
+import subprocess
+import sys
+
+
+# Modules that batch workers import just to compute distances.
+# They must load in a few milliseconds and must not pull in any
+# third-party package.
+CORE_MODULES = [
+    "structures.graph",
+    "structures.generators",
+    "shortest_path",
+    "shortest_path.johnson",
+    "shortest_path.dag_shortest_path",
+    "shortest_path.reachability",
+    "shortest_path.scc_bellman_ford",
+]
+
+# Scripts built on the core: timed on their own line (they may load
+# heavier stdlib modules such as csv), only checked for third-party imports
+SCRIPT_MODULES = [
+    "scaling_experiment",
+]
+
+LOCAL_PACKAGES = {m.split(".")[0] for m in CORE_MODULES + SCRIPT_MODULES}
+
+# Can be raised on slow machines with IMPORT_BUDGET_MS
+BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", 8.0))
+REPEATS = 5
+
+# Runs in a fresh interpreter so nothing is cached in sys.modules
+_PROBE = """
+import sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = (time.perf_counter() - start) * 1000
+new = set(sys.modules) - before
+third_party = sorted(
+    m for m in new
+    if not m.startswith("__")
+    and m.split(".")[0] not in sys.stdlib_module_names
+    and m.split(".")[0] not in {local!r}
+)
+print(elapsed)
+print(",".join(third_party))
+"""
+
+
+def measure_import(modules):
+    """
+    Imports `modules` in a new process and returns
+    (milliseconds, list of third-party modules loaded)
+    """
+    code = _PROBE.format(modules=modules, local=LOCAL_PACKAGES)
+
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    ).stdout.splitlines()
+
+    third_party = [m for m in out[1].split(",") if m] if len(out) > 1 else []
+    return float(out[0]), third_party
+
+
+def best_of(modules):
+    """Best time of REPEATS fresh imports, plus third-party modules seen."""
+    times = []
+    third_party = []
+
+    for _ in range(REPEATS):
+        ms, third_party = measure_import(modules)
+        times.append(ms)
+
+    return min(times), third_party
+
+
+def main():
+    ok = True
+
+    core_ms, core_third = best_of(CORE_MODULES)
+    print(f"Importación del núcleo: {core_ms:.2f} ms "
+          f"(mejor de {REPEATS}, límite {BUDGET_MS:.0f} ms)")
+
+    scripts_ms, scripts_third = best_of(SCRIPT_MODULES)
+    print(f"Importación de {', '.join(SCRIPT_MODULES)}: {scripts_ms:.2f} ms "
+          f"(mejor de {REPEATS}, sin límite)")
+
+    third_party = sorted(set(core_third) | set(scripts_third))
+    if third_party:
+        print(f"[x] Módulos de terceros cargados: {', '.join(third_party)}")
+        ok = False
+    if core_ms > BUDGET_MS:
+        print("[x] Se superó el tiempo de importación del núcleo")
+        ok = False
+
+    if ok:
+        print("[✓] Importación rápida y sin dependencias externas")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+import asyncio
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from structures.graph import Graph
+from shortest_path import dijkstra, get_shortest_path
+
+
+# ==========================
+# Worker side (process pool)
+# ==========================
+# Graphs are shipped once per worker through the pool initializer,
+# so a batch only carries the graph name and the list of sources.
+_WORKER_GRAPHS = {}
+
+
+def _init_worker(graphs):
+    global _WORKER_GRAPHS
+    _WORKER_GRAPHS = graphs
+
+
+def _solve_batch(graph_name, sources):
+    """
+    Runs one Dijkstra per distinct source of the batch. A failing source
+    maps to its exception so it does not fail the rest of the batch.
+
+    Time complexity: O(S * (V + E) log V), S = sources in the batch
+    """
+    g = _WORKER_GRAPHS[graph_name]
+    results = {}
+    for s in sources:
+        try:
+            results[s] = dijkstra(g, s)
+        except Exception as exc:
+            results[s] = exc
+    return results
+
+
+class ServiceOverloaded(Exception):
+    """Raised when the service already has max_pending traversals queued."""
+
+
+class QueryService:
+    """
+    Asyncio front end for shortest path queries
+
+    - Concurrent requests with the same (graph, source) share one traversal
+    - Distinct sources are grouped in batches and sent to a process pool
+    - Each request has its own deadline (timeout)
+    - Backpressure: at most max_pending distinct traversals in flight,
+      new ones are rejected with ServiceOverloaded. A queued traversal
+      whose last waiter gives up is dropped before reaching the pool
+    - A broken pool (e.g. a worker was killed) fails only the affected
+      batches and is replaced
+    """
+
+    def __init__(self, graphs, workers=None, batch_size=16,
+                 batch_window=0.002, max_pending=1024, timeout=1.0):
+        self.graphs = graphs
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.max_pending = max_pending
+        self.timeout = timeout
+
+        self._pool = None
+        self._queue = None
+        self._batcher = None
+        self._inflight = {}   # (graph_name, source) -> Future
+        self._waiters = {}    # (graph_name, source) -> live requests
+        self._queued = set()  # keys not yet sent to the pool
+
+    def _new_pool(self):
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.graphs,)
+        )
+
+    def _replace_pool(self, broken):
+        # Several failed batches may report the same broken pool
+        if self._pool is broken:
+            broken.shutdown(wait=False, cancel_futures=True)
+            self._pool = self._new_pool()
+
+    async def start(self):
+        self._pool = self._new_pool()
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._batch_loop())
+
+    async def close(self):
+        self._batcher.cancel()
+        try:
+            await self._batcher
+        except asyncio.CancelledError:
+            pass
+        for fut in self._inflight.values():
+            if not fut.done():
+                fut.cancel()
+        self._inflight.clear()
+        self._waiters.clear()
+        self._queued.clear()
+        # shutdown(wait=True) blocks, keep it off the event loop
+        await asyncio.to_thread(self._pool.shutdown, True)
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    # ==========================
+    # Public queries
+    # ==========================
+    async def single_source(self, graph_name, source, timeout=None):
+        """Returns (dist, prev) from source, like dijkstra()."""
+        key, fut = self._submit(graph_name, source)
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            # shield: one request timing out must not cancel a shared
+            # traversal other requests are still waiting for
+            return await asyncio.wait_for(
+                asyncio.shield(fut),
+                self.timeout if timeout is None else timeout
+            )
+        finally:
+            self._leave(key, fut)
+
+    async def single_pair(self, graph_name, source, target, timeout=None):
+        """Returns (distance, path) from source to target."""
+        self._check_vertex(graph_name, target)
+        dist, prev = await self.single_source(graph_name, source, timeout)
+        return dist[target], get_shortest_path(prev, source, target)
+
+    # ==========================
+    # Coalescing and batching
+    # ==========================
+    def _check_vertex(self, graph_name, v):
+        if graph_name not in self.graphs:
+            raise KeyError(f"Unknown graph: {graph_name}")
+        if not 0 <= v < self.graphs[graph_name].V:
+            raise ValueError(f"Vertex {v} is not in graph {graph_name}")
+
+    def _submit(self, graph_name, source):
+        self._check_vertex(graph_name, source)
+
+        key = (graph_name, source)
+        fut = self._inflight.get(key)
+        if fut is not None:
+            return key, fut                  # coalesced
+
+        if len(self._inflight) >= self.max_pending:
+            raise ServiceOverloaded(
+                f"{len(self._inflight)} traversals pending"
+            )
+
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        self._queued.add(key)
+        self._queue.put_nowait(key)
+        return key, fut
+
+    def _leave(self, key, fut):
+        """A request stopped waiting (result, error, timeout or cancel)."""
+        left = self._waiters.get(key, 0) - 1
+        if left > 0:
+            self._waiters[key] = left
+            return
+        self._waiters.pop(key, None)
+
+        # Nobody waits for it and it has not reached the pool yet: drop it
+        if key in self._queued and self._inflight.get(key) is fut:
+            self._queued.discard(key)
+            del self._inflight[key]
+            fut.cancel()
+
+    async def _next_key(self):
+        """Next queued key, skipping the ones dropped by _leave."""
+        while True:
+            key = await self._queue.get()
+            if key in self._queued:
+                self._queued.discard(key)
+                return key
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._next_key()]
+            deadline = loop.time() + self.batch_window
+
+            while len(batch) < self.batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._next_key(), remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            by_graph = {}
+            for key in batch:
+                by_graph.setdefault(key[0], []).append(
+                    (key, self._inflight[key])
+                )
+
+            for graph_name, entries in by_graph.items():
+                sources = [key[1] for key, _ in entries]
+                pool = self._pool
+                try:
+                    job = loop.run_in_executor(
+                        pool, _solve_batch, graph_name, sources
+                    )
+                except Exception as exc:
+                    # Broken or shut down pool: fail this batch only
+                    self._fail(entries, exc)
+                    if isinstance(exc, BrokenProcessPool):
+                        self._replace_pool(pool)
+                    continue
+
+                job.add_done_callback(
+                    lambda j, entries=entries, pool=pool:
+                        self._resolve(entries, pool, j)
+                )
+
+    def _fail(self, entries, exc):
+        for key, fut in entries:
+            if self._inflight.get(key) is fut:
+                del self._inflight[key]
+            if not fut.done():
+                fut.set_exception(exc)
+
+    def _resolve(self, entries, pool, job):
+        if job.cancelled():
+            self._fail(entries, asyncio.CancelledError())
+            return
+        if job.exception() is not None:
+            self._fail(entries, job.exception())
+            if isinstance(job.exception(), BrokenProcessPool):
+                self._replace_pool(pool)
+            return
+
+        results = job.result()
+        for key, fut in entries:
+            if self._inflight.get(key) is fut:
+                del self._inflight[key]
+            if fut.done():
+                continue
+            result = results[key[1]]
+            if isinstance(result, Exception):
+                fut.set_exception(result)
+            else:
+                fut.set_result(result)
+
+
+# ==========================
+# Local load generator
+# ==========================
+async def load_test(service, graph_name, requests, concurrency,
+                    hot_sources, timeout=None):
+    """
+    Fires `requests` single-pair queries with at most `concurrency`
+    outstanding, drawing sources from `hot_sources` so that some of them
+    coalesce. Returns latency statistics in seconds; "throughput" counts
+    only answered requests, "offered" counts every request sent.
+    """
+    V = service.graphs[graph_name].V
+    sem = asyncio.Semaphore(concurrency)
+    latencies = []
+    counts = {"ok": 0, "timeout": 0, "rejected": 0, "error": 0}
+
+    async def one():
+        async with sem:
+            s = random.choice(hot_sources)
+            t = random.randrange(V)
+            start = time.perf_counter()
+            try:
+                await service.single_pair(graph_name, s, t, timeout)
+                counts["ok"] += 1
+                latencies.append(time.perf_counter() - start)
+            except asyncio.TimeoutError:
+                counts["timeout"] += 1
+            except ServiceOverloaded:
+                counts["rejected"] += 1
+            except Exception:
+                counts["error"] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+
+    def pct(p):
+        if not latencies:
+            return float("nan")
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))]
+
+    return {
+        **counts,
+        "elapsed": elapsed,
+        "throughput": counts["ok"] / elapsed,
+        "offered": requests / elapsed,
+        "p50": pct(0.50),
+        "p95": pct(0.95),
+        "p99": pct(0.99),
+    }
+
+
+def build_random_graph(n, extra_edges):
+    g = Graph(n)
+    for i in range(n - 1):
+        g.add_edge(i, i + 1, random.randint(1, 10))
+    for _ in range(extra_edges):
+        u = random.randrange(n)
+        v = random.randrange(n)
+        if u != v:
+            g.add_edge(u, v, random.randint(1, 10))
+    return g
+
+
+async def _main():
+    random.seed(42)
+    graphs = {"sparse": build_random_graph(20000, 60000)}
+
+    async with QueryService(graphs, timeout=5.0) as service:
+        for concurrency in (1, 16, 64, 256):
+            stats = await load_test(
+                service, "sparse",
+                requests=2000,
+                concurrency=concurrency,
+                hot_sources=list(range(50))
+            )
+            print(
+                f"concurrencia={concurrency:4d}  "
+                f"ok={stats['ok']}  timeout={stats['timeout']}  "
+                f"rechazadas={stats['rejected']}  "
+                f"errores={stats['error']}  "
+                f"{stats['throughput']:.1f} resp/s "
+                f"({stats['offered']:.1f} req/s enviadas)  "
+                f"p50={stats['p50'] * 1000:.1f} ms  "
+                f"p99={stats['p99'] * 1000:.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
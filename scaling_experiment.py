@@ -1,8 +1,6 @@
+import csv
 import time
 import random
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 from structures.graph import Graph
 from shortest_path import dijkstra, bellman_ford, floyd_warshall
@@ -69,18 +67,33 @@ def run_scaling_experiment():
             except:
                 pass
 
-    # Crear DataFrame
-    df = pd.DataFrame(results, columns=["Algorithm", "Nodes", "Time"])
+    # Promedio por tamaño (sin pandas: solo se necesita para graficar)
+    totals = {}
+    for algorithm, n, t in results:
+        acc = totals.setdefault((algorithm, n), [0.0, 0])
+        acc[0] += t
+        acc[1] += 1
 
-    # Promedio por tamaño
-    df = df.groupby(["Algorithm", "Nodes"]).mean().reset_index()
+    rows = [
+        (algorithm, n, total / count)
+        for (algorithm, n), (total, count) in sorted(totals.items())
+    ]
 
-    df.to_csv("scaling_results.csv", index=False)
+    with open("scaling_results.csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Algorithm", "Nodes", "Time"])
+        writer.writerows(rows)
 
-    return df
+    return rows
 
 
-def plot_results(df):
+def plot_results(rows):
+    # Dependencias pesadas: solo se cargan al graficar
+    import pandas as pd
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    df = pd.DataFrame(rows, columns=["Algorithm", "Nodes", "Time"])
 
     plt.figure(figsize=(10, 6))
 
@@ -97,5 +110,5 @@ def plot_results(df):
 
 if __name__ == "__main__":
 
-    df = run_scaling_experiment()
-    plot_results(df)
+    rows = run_scaling_experiment()
+    plot_results(rows)
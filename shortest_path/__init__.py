@@ -1,3 +1,5 @@
 from .dijkstra import dijkstra, get_shortest_path
 from .bellman_ford import bellman_ford
 from .floyd_warshall import floyd_warshall, get_shortest_path_fw
+from .reachability import ReachabilityIndex, strongly_connected_components
+from .scc_bellman_ford import scc_bellman_ford
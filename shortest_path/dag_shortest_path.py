@@ -1,22 +1,15 @@
 from collections import deque
 
 
-def dag_shortest_path(graph, start):
+def topological_sort(graph):
     """
-    Shortest Path in a DAG (Directed Acyclic Graph)
-
-    Notation:
-    - V: number of vertices
-    - E: number of edges
+    Topological Sort (Kahn's Algorithm)
 
-    Time complexity:
-    - Topological sort: O(V + E)
-    - Edge relaxation: O(E)
-    - Total complexity: O(V + E)
-    - Approximately O(2n)
+    Returns the vertices in topological order. If the graph has cycles,
+    the vertices on (or after) a cycle are left out of the order.
 
-    Space complexity:
-    - Distances + predecessors + indegree: O(V)
+    Time complexity: O(V + E)
+    Space complexity: O(V)
     """
 
     V = graph.V  # O(1)
@@ -27,9 +20,6 @@ def dag_shortest_path(graph, start):
         for v, _ in graph.adj[u]:        # O(E)
             indegree[v] += 1             # O(1)
 
-    # ==========================
-    # 2. Topological Sort (Kahn's Algorithm)
-    # ==========================
     q = deque()
     for v in range(V):                   # O(V)
         if indegree[v] == 0:
@@ -44,15 +34,43 @@ def dag_shortest_path(graph, start):
             if indegree[v] == 0:
                 q.append(v)
 
+    return topo
+
+
+def dag_shortest_path(graph, start):
+    """
+    Shortest Path in a DAG (Directed Acyclic Graph)
+
+    Notation:
+    - V: number of vertices
+    - E: number of edges
+
+    Time complexity:
+    - Topological sort: O(V + E)
+    - Edge relaxation: O(E)
+    - Total complexity: O(V + E)
+    - Approximately O(2n)
+
+    Space complexity:
+    - Distances + predecessors + indegree: O(V)
+    """
+
+    V = graph.V  # O(1)
+
+    # ==========================
+    # 1. Topological Sort (Kahn's Algorithm)
+    # ==========================
+    topo = topological_sort(graph)       # O(V + E)
+
     # ==========================
-    # 3. Initialize distances
+    # 2. Initialize distances
     # ==========================
     dist = {v: float("inf") for v in range(V)}  # O(V)
     prev = {v: None for v in range(V)}          # O(V)
     dist[start] = 0                             # O(1)
 
     # ==========================
-    # 4. Edge Relaxation
+    # 3. Edge Relaxation
     # ==========================
     for u in topo:                       # O(V)
         if dist[u] != float("inf"):
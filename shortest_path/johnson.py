@@ -1,8 +1,9 @@
-from shortest_path import dijkstra, bellman_ford
+from .dijkstra import dijkstra
+from .scc_bellman_ford import scc_bellman_ford
 from structures.graph import Graph
 
 
-def johnson(g: Graph):
+def johnson(g: Graph, reach=None):
     """
     Johnson's Algorithm
 
@@ -11,7 +12,8 @@ def johnson(g: Graph):
     - E: number of edges in the graph
 
     Normal case (sparse graph):
-    - Bellman-Ford runs once: O(V * E)
+    - Potentials with scc_bellman_ford: O(V + E) plus Bellman-Ford
+      inside each SCC, O(V * E) only if the whole graph is one SCC
     - Dijkstra runs V times: O(V * (V + E) log V)
     - Dominant total complexity:
         O(V * E + V * (V + E) log V) = O(V · E log V)
@@ -25,6 +27,9 @@ def johnson(g: Graph):
     - Stores distances for all pairs of nodes: O(V^2)
     - Auxiliary graphs and structures: O(V + E)
     - Total space complexity: O(V^2)
+
+    If a ReachabilityIndex is given as `reach`, sources that reach no
+    other vertex skip their Dijkstra run.
     """
 
     V = g.V  # O(1)
@@ -42,11 +47,12 @@ def johnson(g: Graph):
         g_ext.add_edge(q, v, 0)          # O(1)
 
     # ==========================
-    # Bellman-Ford from q
+    # Potentials: Bellman-Ford from q, SCC by SCC
     # ==========================
-    # Time complexity: O(V * E)
-    # Space complexity: O(V)
-    h, _ = bellman_ford(g_ext, q)
+    # q has no incoming edges, so it is its own component and goes first.
+    # Time complexity: O(V + E + sum of V_c * E_c), worst case O(V * E)
+    # Space complexity: O(V + E)
+    h, _ = scc_bellman_ford(g_ext, q)
 
     # ==========================
     # Reweight edges
@@ -67,6 +73,12 @@ def johnson(g: Graph):
 
     for u in range(V):                   # O(V)
 
+        if reach is not None and not reach.reaches_others(u):
+            dist[u] = {v: float("inf") for v in range(V)}
+            dist[u][u] = 0
+            prev[u] = {v: None for v in range(V)}
+            continue
+
         # Complexity: O((V + E) log V)
         d_rw, p = dijkstra(g_rw, u)
 
@@ -83,7 +95,7 @@ def johnson(g: Graph):
     # Final Analysis:
     # ==========================
     # - Create auxiliary graphs: O(V + E)
-    # - Bellman-Ford: O(V * E)
+    # - SCC Bellman-Ford: O(V + E + sum of V_c * E_c), worst O(V * E)
     # - Dijkstra V times: O(V * (V + E) log V)
     # - Final distance adjustment: O(V^2)
     #
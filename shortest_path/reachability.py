@@ -0,0 +1,179 @@
+from structures.graph import Graph
+from .dag_shortest_path import topological_sort
+from .dijkstra import get_shortest_path
+
+
+def strongly_connected_components(graph):
+    """
+    Strongly Connected Components (iterative Tarjan)
+
+    Returns (comp, count): comp[v] is the component id of vertex v,
+    ids go from 0 to count - 1.
+
+    Time complexity: O(V + E)
+    Space complexity: O(V)
+    """
+
+    V = graph.V
+    index = [-1] * V          # discovery order, -1 = not visited
+    low = [0] * V
+    on_stack = [False] * V
+    stack = []
+    comp = [-1] * V
+    count = 0
+    counter = 0
+
+    for root in range(V):                         # O(V)
+        if index[root] != -1:
+            continue
+
+        # Explicit DFS stack of (vertex, position in its adjacency list)
+        work = [(root, 0)]
+        while work:                               # O(V + E) in total
+            u, i = work.pop()
+
+            if i == 0:
+                index[u] = low[u] = counter
+                counter += 1
+                stack.append(u)
+                on_stack[u] = True
+
+            adj = graph.adj[u]
+            while i < len(adj):
+                v = adj[i][0]
+                if index[v] == -1:
+                    break
+                if on_stack[v] and index[v] < low[u]:
+                    low[u] = index[v]
+                i += 1
+
+            if i < len(adj):
+                # Descend into v, resume u after it
+                work.append((u, i + 1))
+                work.append((adj[i][0], 0))
+                continue
+
+            if low[u] == index[u]:
+                while True:
+                    v = stack.pop()
+                    on_stack[v] = False
+                    comp[v] = count
+                    if v == u:
+                        break
+                count += 1
+
+            if work:
+                parent = work[-1][0]
+                if low[u] < low[parent]:
+                    low[parent] = low[u]
+
+    return comp, count
+
+
+def condensation(graph, comp, count):
+    """
+    Builds the condensation DAG: one vertex per SCC, one edge per
+    distinct pair of connected components (weights are ignored).
+
+    Time complexity: O(V + E)
+    """
+
+    dag = Graph(count, directed=True)
+    seen = set()
+
+    for u in range(graph.V):                      # O(V)
+        cu = comp[u]
+        for v, _ in graph.adj[u]:                 # O(E)
+            cv = comp[v]
+            if cu != cv and (cu, cv) not in seen:
+                seen.add((cu, cv))
+                dag.add_edge(cu, cv)
+
+    return dag
+
+
+class ReachabilityIndex:
+    """
+    Transitive closure over the SCC condensation
+
+    Each component gets a row used as a bitset: bit c is set when
+    component c is reachable. Rows are built as Python ints, OR-ed in
+    reverse topological order so every successor row is complete before
+    it is used, and then packed into bytes so a query reads one byte
+    instead of shifting a C-bit integer.
+
+    Notation:
+    - C: number of strongly connected components
+    - E_c: number of edges in the condensation DAG
+
+    Build time complexity:
+    - SCC + condensation + topological sort: O(V + E)
+    - Closure: O(E_c * C / w), w = machine word size
+    Space complexity: O(V + C^2 / w)
+
+    Query time complexity: O(1)
+    """
+
+    def __init__(self, graph):
+        self.comp, self.count = strongly_connected_components(graph)
+        self.dag = condensation(graph, self.comp, self.count)
+
+        # Kahn order of the condensation (always a DAG)
+        topo = topological_sort(self.dag)
+
+        rows = [0] * self.count
+        for c in reversed(topo):                  # O(C)
+            row = 1 << c
+            for d, _ in self.dag.adj[c]:          # O(E_c)
+                row |= rows[d]                    # O(C / w)
+            rows[c] = row
+
+        self.members = [[] for _ in range(self.count)]
+        for v in range(graph.V):                  # O(V)
+            self.members[self.comp[v]].append(v)
+
+        # Packed rows: bit k of row c is byte k >> 3, bit k & 7
+        nbytes = (self.count + 7) // 8
+        self.rows = [
+            row.to_bytes(nbytes, "little") for row in rows   # O(C^2 / 8)
+        ]
+        self._reaches_others = [
+            rows[c] != 1 << c or len(self.members[c]) > 1
+            for c in range(self.count)
+        ]
+
+    def reachable(self, u, v):
+        """True if there is a path from u to v (u reaches itself)."""
+        k = self.comp[v]
+        return self.rows[self.comp[u]][k >> 3] >> (k & 7) & 1 == 1
+
+    def reaches_others(self, u):
+        """True if u reaches at least one vertex other than itself."""
+        return self._reaches_others[self.comp[u]]
+
+    def reachable_from(self, u):
+        """
+        All vertices reachable from u
+        Time complexity: O(C / w) per reachable component
+        """
+        row = int.from_bytes(self.rows[self.comp[u]], "little")
+        out = []
+        while row:
+            low = row & -row                      # lowest set bit
+            out.extend(self.members[low.bit_length() - 1])
+            row ^= low
+        return out
+
+
+def shortest_distance(graph, source, target, index, solver):
+    """
+    Single-pair distance using any single-source solver
+    (dijkstra, bellman_ford, dag_shortest_path).
+
+    Unreachable pairs are answered in O(1) without running the solver.
+    """
+    if not index.reachable(source, target):
+        return float("inf"), []
+
+    dist, prev = solver(graph, source)
+    return dist[target], get_shortest_path(prev, source, target)
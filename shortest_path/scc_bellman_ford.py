@@ -0,0 +1,103 @@
+from .dag_shortest_path import topological_sort
+from .reachability import strongly_connected_components, condensation
+
+
+def scc_bellman_ford(graph, start):
+    """
+    Bellman-Ford accelerated with the SCC structure
+
+    Components are visited in topological order of the condensation DAG.
+    Inside a component Bellman-Ford runs only over its own edges (with
+    early exit when a round changes nothing); edges between components
+    are relaxed once, as in dag_shortest_path.
+
+    Notation:
+    - V, E: vertices and edges of the graph
+    - V_c, E_c: vertices and internal edges of component c
+      (edges leaving c are not counted in E_c)
+
+    Time complexity:
+    - SCC + condensation + topological sort: O(V + E)
+    - Internal adjacency lists: O(V + E)
+    - Bellman-Ford per component: O(sum of V_c * E_c)
+    - Edges between components: O(E)
+    - DAG (all components of size 1): O(V + E)
+    - One strongly connected graph: O(V * E), same as bellman_ford
+
+    Space complexity: O(V + E)
+
+    Same result as bellman_ford: (dist, prev), ValueError if a negative
+    cycle is reachable from start.
+    """
+
+    INF = float("inf")
+    V = graph.V
+    adj = graph.adj
+
+    comp, count = strongly_connected_components(graph)   # O(V + E)
+    topo = topological_sort(condensation(graph, comp, count))  # O(V + E)
+
+    members = [[] for _ in range(count)]
+    for v in range(V):                                   # O(V)
+        members[comp[v]].append(v)
+
+    # Internal / outgoing edges split once, so the rounds below only
+    # scan the component's own edges
+    inner = {}
+    outer = {}
+    for u in range(V):                                   # O(V)
+        cu = comp[u]
+        inner[u] = [(v, w) for v, w in adj[u] if comp[v] == cu]   # O(E)
+        outer[u] = [(v, w) for v, w in adj[u] if comp[v] != cu]
+
+    dist = {v: INF for v in range(V)}                    # O(V)
+    prev = {v: None for v in range(V)}                   # O(V)
+    dist[start] = 0
+
+    for c in topo:                                       # O(C)
+        nodes = members[c]
+
+        if all(dist[u] == INF for u in nodes):           # O(V_c)
+            continue
+
+        # ==========================
+        # Bellman-Ford inside the component
+        # ==========================
+        for _ in range(len(nodes) - 1):                  # O(V_c)
+            changed = False
+            for u in nodes:
+                du = dist[u]
+                if du == INF:
+                    continue
+                for v, w in inner[u]:                    # O(E_c)
+                    if du + w < dist[v]:
+                        dist[v] = du + w
+                        prev[v] = u
+                        changed = True
+            if not changed:
+                break
+        else:
+            # V_c - 1 rounds were needed: check for a negative cycle
+            for u in nodes:
+                du = dist[u]
+                if du == INF:
+                    continue
+                for v, w in inner[u]:                    # O(E_c)
+                    if du + w < dist[v]:
+                        raise ValueError(
+                            "The graph contains a negative weight cycle"
+                        )
+
+        # ==========================
+        # Relax edges leaving the component (DAG step)
+        # ==========================
+        for u in nodes:
+            du = dist[u]
+            if du == INF:
+                continue
+            for v, w in outer[u]:                        # O(E) in total
+                if du + w < dist[v]:
+                    dist[v] = du + w
+                    prev[v] = u
+
+    return dist, prev
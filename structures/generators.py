@@ -0,0 +1,233 @@
+from .graph import Graph
+
+
+# NumPy is only needed to generate graphs, so it is imported inside each
+# generator and the core structures/shortest_path import stays dependency-free.
+
+
+class EdgeList:
+    """
+    Compact edge storage: three parallel NumPy arrays (src, dst, weight)
+    sorted by source, plus optional node coordinates.
+
+    Space complexity: O(V + E) machine integers (no Python tuples)
+    """
+
+    def __init__(self, n, src, dst, weight, coords=None):
+        self.V = n
+        self.src = src
+        self.dst = dst
+        self.weight = weight
+        self.coords = coords
+
+    def __len__(self):
+        return len(self.src)
+
+    def edges(self):
+        """List of (u, v, w) tuples, e.g. for draw_large_graph."""
+        return list(zip(
+            self.src.tolist(), self.dst.tolist(), self.weight.tolist()
+        ))
+
+    def positions(self):
+        """
+        {node: (x, y)} from coords, or None if the generator has none.
+        Usable as draw_large_graph(e.edges(), title, pos=e.positions()).
+        """
+        if self.coords is None:
+            return None
+        return {i: (x, y) for i, (x, y) in enumerate(self.coords.tolist())}
+
+    def to_graph(self):
+        """
+        Builds a Graph without calling add_edge per edge
+        Time complexity: O(V + E)
+        """
+        g = Graph(self.V, directed=True)
+        adj = g.adj
+        for u, v, w in zip(self.src.tolist(), self.dst.tolist(),
+                           self.weight.tolist()):
+            adj[u].append((v, w))
+        return g
+
+    def save(self, path):
+        import numpy as np
+
+        arrays = {"n": self.V, "src": self.src, "dst": self.dst,
+                  "weight": self.weight}
+        if self.coords is not None:
+            arrays["coords"] = self.coords
+        np.savez_compressed(path, **arrays)
+
+    @staticmethod
+    def load(path):
+        import numpy as np
+
+        data = np.load(path)
+        coords = data["coords"] if "coords" in data.files else None
+        return EdgeList(int(data["n"]), data["src"], data["dst"],
+                        data["weight"], coords)
+
+
+def _finish(n, src, dst, weight, coords=None, limit=None):
+    """
+    Removes self loops and duplicate (u, v) pairs (first one wins),
+    optionally keeps only `limit` edges, and sorts by source.
+
+    Time complexity: O(E log E)
+    """
+    import numpy as np
+
+    keep = src != dst
+    src, dst, weight = src[keep], dst[keep], weight[keep]
+
+    key = src.astype(np.int64) * n + dst
+    _, first = np.unique(key, return_index=True)
+    first.sort()                       # keep sampling order for `limit`
+    if limit is not None:
+        first = first[:limit]
+
+    order = first[np.argsort(src[first], kind="stable")]
+    return EdgeList(
+        n,
+        src[order].astype(np.int32),
+        dst[order].astype(np.int32),
+        weight[order].astype(np.int64),
+        coords
+    )
+
+
+def grid_graph(rows, cols, seed=None, jitter=0.3, drop=0.1, max_detour=1.5):
+    """
+    Road-like graph: a rows x cols grid with jittered coordinates,
+    edges in both directions between neighbours and a fraction `drop`
+    of streets removed. Weight = round(10 * length * detour factor).
+
+    Time complexity: O(V + E)
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    n = rows * cols
+
+    r, c = np.divmod(np.arange(n), cols)
+    coords = np.column_stack((c, r)).astype(np.float64)
+    coords += rng.uniform(-jitter, jitter, size=coords.shape)
+
+    ids = np.arange(n).reshape(rows, cols)
+    right = (ids[:, :-1].ravel(), ids[:, 1:].ravel())
+    down = (ids[:-1, :].ravel(), ids[1:, :].ravel())
+    a = np.concatenate((right[0], down[0]))
+    b = np.concatenate((right[1], down[1]))
+
+    streets = rng.random(len(a)) >= drop
+    a, b = a[streets], b[streets]
+
+    length = np.linalg.norm(coords[a] - coords[b], axis=1)
+    detour = rng.uniform(1.0, max_detour, size=len(a))
+    w = np.maximum(1, np.rint(10 * length * detour)).astype(np.int64)
+
+    src = np.concatenate((a, b))
+    dst = np.concatenate((b, a))
+    weight = np.concatenate((w, w))
+    return _finish(n, src, dst, weight, coords)
+
+
+def erdos_renyi(n, m, seed=None, max_weight=10):
+    """
+    G(n, m): m distinct random edges, weights uniform in [1, max_weight]
+
+    Time complexity: O(m log m) expected (oversample, deduplicate, trim)
+    """
+    import numpy as np
+
+    m = min(m, n * (n - 1))
+    rng = np.random.default_rng(seed)
+
+    src = np.empty(0, dtype=np.int64)
+    dst = np.empty(0, dtype=np.int64)
+    edges = _finish(n, src, dst, np.empty(0, dtype=np.int64))
+
+    while len(edges) < m:
+        extra = int((m - len(edges)) * 1.1) + 16
+        src = np.concatenate((edges.src, rng.integers(0, n, size=extra)))
+        dst = np.concatenate((edges.dst, rng.integers(0, n, size=extra)))
+        weight = np.concatenate(
+            (edges.weight, rng.integers(1, max_weight + 1, size=extra))
+        )
+        edges = _finish(n, src, dst, weight, limit=m)
+
+    return edges
+
+
+def rmat_graph(scale, edge_factor=16, a=0.57, b=0.19, c=0.19,
+               seed=None, max_weight=10):
+    """
+    R-MAT power-law graph (Graph500 parameters by default):
+    2^scale nodes, about edge_factor * 2^scale edges before deduplication.
+    Node ids are shuffled so hubs are not all at low ids.
+
+    Time complexity: O(scale * E) vectorized + O(E log E) deduplication
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    n = 1 << scale
+    m = edge_factor * n
+
+    src = np.zeros(m, dtype=np.int64)
+    dst = np.zeros(m, dtype=np.int64)
+    for bit in range(scale):
+        r = rng.random(m)
+        # Quadrants: a = (0, 0), b = (0, 1), c = (1, 0), d = (1, 1)
+        src_bit = r >= a + b
+        dst_bit = ((r >= a) & (r < a + b)) | (r >= a + b + c)
+        src |= src_bit.astype(np.int64) << bit
+        dst |= dst_bit.astype(np.int64) << bit
+
+    perm = rng.permutation(n)
+    weight = rng.integers(1, max_weight + 1, size=m)
+    return _finish(n, perm[src], perm[dst], weight)
+
+
+def layered_dag(layers, width, degree, seed=None, span=1, max_weight=10):
+    """
+    Layered DAG: `layers` layers of `width` nodes, each node gets `degree`
+    edges to random nodes in the next 1..span layers. Every edge goes
+    forward, so the result is acyclic (valid for dag_shortest_path).
+
+    Time complexity: O(E log E)
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    n = layers * width
+
+    src = np.repeat(np.arange((layers - 1) * width), degree)
+    layer = src // width
+    jump = rng.integers(1, span + 1, size=len(src))
+    target_layer = np.minimum(layer + jump, layers - 1)
+    dst = target_layer * width + rng.integers(0, width, size=len(src))
+
+    weight = rng.integers(1, max_weight + 1, size=len(src))
+    return _finish(n, src, dst, weight)
+
+
+def with_potentials(edges, max_potential, seed=None):
+    """
+    Makes some weights negative without creating negative cycles:
+    w'(u, v) = w(u, v) + p(u) - p(v) with random potentials p.
+    Every cycle keeps its original (non-negative) total weight, so the
+    input weights must be >= 0.
+
+    Time complexity: O(V + E)
+    """
+    import numpy as np
+
+    if len(edges) and edges.weight.min() < 0:
+        raise ValueError("with_potentials needs non-negative input weights")
+
+    rng = np.random.default_rng(seed)
+    p = rng.integers(0, max_potential + 1, size=edges.V)
+    weight = edges.weight + p[edges.src] - p[edges.dst]
+    return EdgeList(edges.V, edges.src, edges.dst, weight, edges.coords)